@@ -5,19 +5,32 @@
 # NOTES ON SECURITY:
 # - On HDDs, multiple overwrites via `shred` are effective.
 # - On SSDs, due to wear-leveling, per-file overwrites are not guaranteed.
-#   This tool deletes files and proactively issues TRIM (fstrim) for the mount.
-#   For whole-disk secure erase on SSDs, use manufacturer tools or `blkdiscard`
-#   / `nvme format` at your own risk (NOT exposed by default in this GUI).
+#   This tool deletes files (no overwrite, it would only add wear) and
+#   proactively issues TRIM (fstrim) for the mount.
+#   For whole-device erase, a separate `blkdiscard -f` action is available
+#   (explicit device path + confirmation). Manufacturer tools / `nvme format`
+#   remain the stronger option.
 #
-# Dependencies: python3, PyQt5, coreutils (shred), util-linux (fstrim, findmnt)
+# Dependencies: python3, PyQt5, coreutils (shred), util-linux (fstrim, lsblk, blkdiscard)
 
 import os
+import re
+import collections
 import sys
 import subprocess
+import selectors
 import shutil
+import stat
 import pathlib
+import threading
+import functools
+import itertools
+import time
+import mmap
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 
 from PyQt5 import QtWidgets, QtGui, QtCore
 
@@ -28,9 +41,48 @@ RED = "#ff2b2b"
 DARK = "#0b0b0b"
 ACCENT = "#e60000"
 
+DEFAULT_THREADS = min(os.cpu_count() or 1, 8)
+BULK_ADD_THRESHOLD = 256
+SSD_BATCH = 64
+SHRED_BATCH = 128
+OVERWRITE_BLOCK = 1024*1024
+DIRECT_ALIGN = 4096
+
+# The progress bar runs 0..PROGRESS_SCALE so huge trees still move visibly;
+# worker signals to the UI are coalesced to at most one per EMIT_INTERVAL.
+PROGRESS_SCALE = 10000
+EMIT_INTERVAL = 0.05
+
+NO_OVERWRITE_FS = {"btrfs", "zfs", "tmpfs", "overlay", "f2fs"}
+
+# Concurrent wipes allowed per physical disk.
+HDD_CONCURRENCY = 1
+SSD_CONCURRENCY = 16
+NVME_CONCURRENCY = 32
+
+# Outstanding batches per device queue; refilled only as completions drain.
+try:
+    MAX_INFLIGHT = max(1, int(os.environ.get("SKYNET_QUEUE_DEPTH", "16")))
+except ValueError:
+    MAX_INFLIGHT = 16
+
 def which(prog: str) -> Optional[str]:
     return shutil.which(prog)
 
+# Resolved once at import: every which() stats each $PATH entry.
+SHRED_PROG = which("shred")
+SRM_PROG = which("srm")
+FSTRIM_PROG = which("fstrim")
+BLKDISCARD_PROG = which("blkdiscard")
+
+def _refresh_tools():
+    """Re-resolve the external tools, e.g. after $PATH changed at runtime."""
+    global SHRED_PROG, SRM_PROG, FSTRIM_PROG, BLKDISCARD_PROG
+    SHRED_PROG = which("shred")
+    SRM_PROG = which("srm")
+    FSTRIM_PROG = which("fstrim")
+    BLKDISCARD_PROG = which("blkdiscard")
+
 def run(cmd: List[str]) -> Tuple[int, str, str]:
     try:
         proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
@@ -39,10 +91,87 @@ def run(cmd: List[str]) -> Tuple[int, str, str]:
     except Exception as e:
         return 1, "", str(e)
 
+def run_streaming(cmd: List[str], on_stderr: Optional[Callable[[str], None]] = None,
+                  on_stdout: Optional[Callable[[str], None]] = None) -> Tuple[int, str, str]:
+    """Like run(), but hands every output line to the callbacks as soon as it arrives."""
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except Exception as e:
+        return 1, "", str(e)
+    callbacks = {proc.stdout: on_stdout, proc.stderr: on_stderr}
+    lines = {proc.stdout: [], proc.stderr: []}
+    partial = {proc.stdout: b"", proc.stderr: b""}
+    with selectors.DefaultSelector() as sel:
+        sel.register(proc.stdout, selectors.EVENT_READ)
+        sel.register(proc.stderr, selectors.EVENT_READ)
+        while sel.get_map():
+            for key, _ in sel.select():
+                stream = key.fileobj
+                # Raw reads: a buffered readline() could hold lines back until
+                # the next chunk arrives, which is what we want to avoid.
+                data = os.read(stream.fileno(), 65536)
+                if data:
+                    *done, partial[stream] = (partial[stream] + data).split(b"\n")
+                else:
+                    sel.unregister(stream)
+                    done = [partial[stream]] if partial[stream] else []
+                for raw in done:
+                    line = raw.decode(errors="replace")
+                    lines[stream].append(line)
+                    if callbacks[stream]:
+                        callbacks[stream](line)
+    proc.stdout.close()
+    proc.stderr.close()
+    return proc.wait(), "\n".join(lines[proc.stdout]), "\n".join(lines[proc.stderr])
+
+def _unescape_mount(field: str) -> str:
+    # mountinfo escapes space, tab, newline and backslash as \ooo
+    return re.sub(r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), field)
+
+def read_mountinfo() -> List[Tuple[str, str, str, str, str]]:
+    """(mountpoint, source, fstype, super options, major:minor) for every line of /proc/self/mountinfo."""
+    entries = []
+    try:
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                parts = line.split()
+                sep = parts.index("-")
+                opts = parts[sep + 3] if len(parts) > sep + 3 else ""
+                entries.append((_unescape_mount(parts[4]), _unescape_mount(parts[sep + 2]), parts[sep + 1], opts, parts[2]))
+    except (OSError, ValueError, IndexError):
+        pass
+    return entries
+
+def overwrite_is_futile(fstype: str, options: str) -> bool:
+    # Copy-on-write / log-structured filesystems write the new data
+    # elsewhere, tmpfs has no blocks, and data=journal ext3/4 puts a copy in
+    # the journal first: shred cannot reach the old blocks on any of them.
+    if fstype in NO_OVERWRITE_FS:
+        return True
+    return fstype in ("ext3", "ext4") and "data=journal" in options.split(",")
+
+_mounts: Optional[List[Tuple[str, str, str, str, str]]] = None
+
+def load_mounts() -> List[Tuple[str, str, str, str, str]]:
+    """(Re)read the mount table, ordered so the first prefix match is the visible mount."""
+    global _mounts
+    # Longest mountpoint first. Stacked mounts share a mountpoint and only
+    # the last one mounted is visible, hence reversed() before the stable sort.
+    _mounts = sorted(reversed(read_mountinfo()), key=lambda m: len(m[0]), reverse=True)
+    return _mounts
+
+def _find_mount(path: str) -> Optional[Tuple[str, str, str, str, str]]:
+    p = os.path.realpath(path)
+    for entry in (_mounts if _mounts is not None else load_mounts()):
+        mp = entry[0]
+        if p == mp or p.startswith(mp.rstrip("/") + "/"):
+            return entry
+    return None
+
 def get_mountpoint(path: str) -> Optional[str]:
-    rc, out, err = run(["findmnt", "-T", path, "-no", "TARGET"])
-    if rc == 0:
-        return out.strip()
+    entry = _find_mount(path)
+    if entry:
+        return entry[0]
     p = pathlib.Path(path).resolve()
     while p != p.parent:
         if os.path.ismount(str(p)):
@@ -51,35 +180,76 @@ def get_mountpoint(path: str) -> Optional[str]:
     return None
 
 def get_block_device_for_path(path: str) -> Optional[str]:
-    rc, out, err = run(["findmnt", "-T", path, "-no", "SOURCE"])
-    if rc != 0:
+    entry = _find_mount(path)
+    if not entry:
         return None
-    return out.strip() or None
-
+    source, devno = entry[1], entry[4]
+    if source.startswith("/dev/") and source != "/dev/root" and os.path.exists(source):
+        return source
+    # The source string is not a usable node (e.g. /dev/root when the kernel
+    # mounted root itself): name the device by its major:minor instead.
+    sys_dev = f"/sys/dev/block/{devno}"
+    if os.path.exists(sys_dev):
+        return "/dev/" + os.path.basename(os.path.realpath(sys_dev))
+    return source
+
+def _sys_block_dir(dev: str) -> Optional[str]:
+    try:
+        st = os.stat(dev)
+    except OSError:
+        return None
+    if not stat.S_ISBLK(st.st_mode):
+        return None
+    p = f"/sys/dev/block/{os.major(st.st_rdev)}:{os.minor(st.st_rdev)}"
+    return os.path.realpath(p) if os.path.exists(p) else None
+
+def get_fs_type(path: str) -> Tuple[str, str]:
+    """(fstype, super options) of the filesystem holding path, or empty strings."""
+    entry = _find_mount(path)
+    return (entry[2], entry[3]) if entry else ("", "")
+
+def get_holders(dev: str) -> List[str]:
+    """Devices stacked on dev or its partitions (LVM, md, dm-crypt), from sysfs holders/."""
+    d = _sys_block_dir(dev)
+    if not d:
+        return []
+    dirs = [d] + [os.path.join(d, n) for n in sorted(os.listdir(d))
+                  if os.path.exists(os.path.join(d, n, "partition"))]
+    holders = []
+    for sub in dirs:
+        try:
+            holders += sorted(os.listdir(os.path.join(sub, "holders")))
+        except OSError:
+            pass
+    return holders
+
+@functools.lru_cache(maxsize=None)
+def get_base_device(dev: str) -> Optional[str]:
+    """Name of the whole disk under dev (e.g. sda for /dev/sda2), as found in /sys/block."""
+    d = _sys_block_dir(dev)
+    # Partitions sit inside their disk's sysfs directory; device-mapper and
+    # md devices list what they are built on under slaves/.
+    for _ in range(16):
+        if not d:
+            break
+        if os.path.exists(os.path.join(d, "partition")):
+            d = os.path.dirname(d)
+            continue
+        try:
+            slaves = sorted(os.listdir(os.path.join(d, "slaves")))
+        except OSError:
+            slaves = []
+        if slaves:
+            d = os.path.realpath(os.path.join(d, "slaves", slaves[0]))
+            continue
+        return os.path.basename(d)
+    name = os.path.basename(dev)
+    return name if os.path.exists(f"/sys/block/{name}") else None
+
+@functools.lru_cache(maxsize=None)
 def is_rotational_device(dev: str) -> Optional[bool]:
     try:
-        if dev.startswith("/dev/mapper/"):
-            rc, out, err = run(["lsblk", "-no", "PKNAME", dev])
-            if rc == 0 and out.strip():
-                base = out.strip()
-            else:
-                rc, out, err = run(["lsblk", "-no", "NAME", dev])
-                if rc == 0 and out.strip():
-                    base = out.strip().splitlines()[-1]
-                else:
-                    base = None
-        else:
-            name = os.path.basename(dev)
-            if name.startswith("nvme"):
-                base = "".join(name.split("p")[:1])
-                rc, out, err = run(["lsblk", "-no", "PKNAME", dev])
-                if rc == 0 and out.strip():
-                    base = out.strip()
-            else:
-                base = ''.join([c for c in name if not c.isdigit()])
-                rc, out, err = run(["lsblk", "-no", "PKNAME", dev])
-                if rc == 0 and out.strip():
-                    base = out.strip()
+        base = get_base_device(dev)
         if not base:
             return None
         path = f"/sys/block/{base}/queue/rotational"
@@ -91,6 +261,35 @@ def is_rotational_device(dev: str) -> Optional[bool]:
     except Exception:
         return None
 
+def device_concurrency(dev: str, rotational: Optional[bool]) -> int:
+    # Spinning disks (and anything we could not classify) get one file at a
+    # time: concurrent wipes only make the head seek back and forth.
+    if rotational is not False:
+        return HDD_CONCURRENCY
+    base = get_base_device(dev) or os.path.basename(dev)
+    return NVME_CONCURRENCY if base.startswith("nvme") else SSD_CONCURRENCY
+
+def _iter_tree(path: str) -> Iterator[Tuple[str, bool]]:
+    """Yield (path, is_dir) for everything below path, children before their parent.
+
+    DirEntry.is_dir(follow_symlinks=False) is answered from the d_type that
+    getdents already returned, so no extra stat is issued per entry.
+    Unreadable directories are skipped, like os.walk does.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False
+        if is_dir:
+            yield from _iter_tree(entry.path)
+        yield entry.path, is_dir
+
 @dataclass
 class TargetItem:
     path: str
@@ -112,11 +311,7 @@ class DropList(QtWidgets.QListWidget):
         e.acceptProposedAction()
 
     def dropEvent(self, e: QtGui.QDropEvent):
-        paths = []
-        for url in e.mimeData().urls():
-            local = url.toLocalFile()
-            if local:
-                paths.append(local)
+        paths = [u.toLocalFile() for u in e.mimeData().urls() if u.isLocalFile()]
         if paths:
             self.files_dropped.emit(paths)
 
@@ -126,9 +321,31 @@ class LogView(QtWidgets.QPlainTextEdit):
         self.setReadOnly(True)
         self.setMaximumBlockCount(5000)
         self.setStyleSheet("QPlainTextEdit { background: #0a0a0a; color: #e6e6e6; border: 1px solid #300; }")
+        # Lines are queued and written in one edit at 20 Hz: appendPlainText
+        # per line re-lays out the document for every single message.
+        self._buf = collections.deque()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(50)
+        self._timer.timeout.connect(self._flush)
+        self._timer.start()
 
     def log(self, text: str):
-        self.appendPlainText(text)
+        self._buf.append(text)
+
+    def _flush(self):
+        if not self._buf:
+            return
+        batch = []
+        while self._buf:
+            batch.append(self._buf.popleft())
+        bar = self.verticalScrollBar()
+        at_bottom = bar.value() == bar.maximum()
+        cursor = QtGui.QTextCursor(self.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        text = "\n".join(batch)
+        cursor.insertText(text if self.document().isEmpty() else "\n" + text)
+        if at_bottom:
+            bar.setValue(bar.maximum())
 
 class ShredWorker(QtCore.QThread):
     progress = QtCore.pyqtSignal(int)
@@ -136,154 +353,377 @@ class ShredWorker(QtCore.QThread):
     finished_ok = QtCore.pyqtSignal()
     finished_err = QtCore.pyqtSignal(str)
 
-    def __init__(self, paths: List[str], passes: int, gutmann: bool, ssd_mode: bool, trim_after: bool):
+    def __init__(self, paths: List[str], passes: int, gutmann: bool, ssd_mode: bool, trim_after: bool,
+                 threads: int = DEFAULT_THREADS):
         super().__init__()
         self.paths = paths
         self.passes = passes
         self.gutmann = gutmann
         self.ssd_mode = ssd_mode
         self.trim_after = trim_after
+        self.threads = max(1, threads)
         self._stop = False
+        self._trim_lock = threading.Lock()
+        self._mountpoints_to_trim = set()
+        self._dev_semaphores: Dict[str, threading.Semaphore] = {}
+        self._progress_lock = threading.Lock()
+        self._done = 0
+        self._total = 0
+        self._last_pct = -1
+        self._log_lock = threading.Lock()
+        self._log_buf: List[str] = []
+        # One random block per worker, reused for every file. Fresh random
+        # data per file adds nothing (and on SSDs wear-leveling defeats
+        # per-file overwrites anyway), it only costs getrandom() + 1 MiB
+        # allocations. The mmap copy is page-aligned for O_DIRECT writes.
+        self._rand_block = os.urandom(OVERWRITE_BLOCK)
+        self._direct_block = mmap.mmap(-1, OVERWRITE_BLOCK)
+        self._direct_block.write(self._rand_block)
 
     def stop(self):
         self._stop = True
 
     def run(self):
-        total = len(self.paths)
-        done = 0
-        mountpoints_to_trim = set()
+        self._mountpoints_to_trim = set()
+        # Mounts may have changed since the last run.
+        load_mounts()
+        get_base_device.cache_clear()
+        is_rotational_device.cache_clear()
 
-        shred_prog = which("shred")
-        srm_prog = which("srm")
-        fstrim_prog = which("fstrim")
+        skipped_mounts = set()
 
+        # Group files by block device: each device gets its own pool below.
+        buckets = {}
+        dirs_to_remove = []
         for p in self.paths:
             if self._stop:
                 break
             try:
                 if not os.path.exists(p):
-                    self.status.emit(f"[!] Not found: {p}")
-                    done += 1
-                    self.progress.emit(int(done * 100 / total))
+                    self._log(f"[!] Not found: {p}")
                     continue
 
                 mp = get_mountpoint(p) or "/"
                 dev = get_block_device_for_path(p) or ""
                 rotational = is_rotational_device(dev)
                 rotational_str = {True: "HDD", False: "SSD", None: "Unknown"}.get(rotational, "Unknown")
-                self.status.emit(f"[i] Target: {p}  (Mount: {mp}, Device: {dev}, Type: {rotational_str})")
+                fstype, fs_opts = get_fs_type(p)
+                self._log(f"[i] Target: {p}  (Mount: {mp}, Device: {dev}, Type: {rotational_str}, FS: {fstype or 'unknown'})")
+                # skip_fs is set when shred cannot reach the old blocks on this
+                # filesystem; those files are only deleted (see _remove_batch).
+                skip_fs = None
+                if rotational is not False and overwrite_is_futile(fstype, fs_opts):
+                    skip_fs = fstype
+                    if mp not in skipped_mounts:
+                        skipped_mounts.add(mp)
+                        self._log(f"[WARN] {mp} is {fstype}: overwriting cannot reach the old blocks there, skipping shred (delete only)")
 
                 if os.path.isdir(p):
-                    all_files = []
-                    for root, dirs, files in os.walk(p, topdown=False):
-                        for name in files:
-                            all_files.append(os.path.join(root, name))
-                    for f in all_files:
-                        self._wipe_file(f, shred_prog, srm_prog, rotational, mp)
-                    for root, dirs, files in os.walk(p, topdown=False):
-                        for d in dirs:
-                            dpath = os.path.join(root, d)
-                            try:
-                                os.rmdir(dpath)
-                            except Exception:
-                                pass
-                    try:
-                        os.rmdir(p)
-                    except Exception:
-                        pass
+                    files = []
+                    for entry, is_dir in _iter_tree(p):
+                        if is_dir:
+                            dirs_to_remove.append(entry)
+                        else:
+                            files.append(entry)
+                    dirs_to_remove.append(p)
                 else:
-                    self._wipe_file(p, shred_prog, srm_prog, rotational, mp)
+                    files = [p]
 
-                mountpoints_to_trim.add(mp)
-                done += 1
-                self.progress.emit(int(done * 100 / total))
+                buckets.setdefault((dev, skip_fs), []).extend((f, mp) for f in files)
             except Exception as e:
-                self.status.emit(f"[ERR] {p}: {e}")
-
-        if self.trim_after and fstrim_prog and mountpoints_to_trim:
-            for mp in mountpoints_to_trim:
-                self.status.emit(f"[TRIM] fstrim {mp} ...")
-                rc, out, err = run([fstrim_prog, "-v", mp])
+                self._log(f"[ERR] {p}: {e}")
+
+        self._done = 0
+        self._total = sum(len(jobs) for jobs in buckets.values())
+        self._last_pct = -1
+        with ExitStack() as stack:
+            inflight = {}
+
+            def feed(queue):
+                pool, batches, rotational, skip_fs, trim, sem = queue
+                batch = next(batches, None)
+                if batch is not None:
+                    fut = pool.submit(self._wipe_throttled, sem, batch, SHRED_PROG, SRM_PROG, rotational, skip_fs, trim)
+                    inflight[fut] = queue
+
+            self._dev_semaphores = {}
+            for (dev, skip_fs), jobs in buckets.items():
+                # Partitions of the same disk share one semaphore, so e.g.
+                # sda1 and sda2 together still get a single HDD slot.
+                rotational = is_rotational_device(dev)
+                limit = device_concurrency(dev, rotational)
+                disk = get_base_device(dev) or dev
+                sem = self._dev_semaphores.setdefault(disk, threading.Semaphore(limit))
+                workers = min(self.threads, limit)
+                pool = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+                # SSD files are only unlinked, so they are handed out in
+                # batches to keep the per-task overhead down. shred takes many
+                # files per invocation, which saves a fork/exec per file.
+                if rotational is False or skip_fs:
+                    step = SSD_BATCH
+                elif SHRED_PROG:
+                    step = SHRED_BATCH
+                else:
+                    step = 1
+                it = iter(jobs)
+                batches = iter(lambda: list(itertools.islice(it, step)), [])
+                # tmpfs, overlay & co. have no block device to fstrim.
+                trim = dev.startswith("/dev/")
+                queue = (pool, batches, rotational, skip_fs, trim, sem)
+                for _ in range(max(MAX_INFLIGHT, workers)):
+                    feed(queue)
+
+            # The pool threads only record progress and per-file lines; this
+            # loop publishes them at most once per EMIT_INTERVAL, and at least
+            # that often while a long shred pass is running.
+            last_publish = time.monotonic()
+            while inflight:
+                finished, _ = wait(inflight, timeout=EMIT_INTERVAL, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    queue = inflight.pop(fut)
+                    try:
+                        fut.result()
+                    except Exception as e:
+                        self._log(f"[ERR] {e}")
+                    feed(queue)
+                now = time.monotonic()
+                if now - last_publish >= EMIT_INTERVAL:
+                    self._publish()
+                    last_publish = now
+
+        self._publish()
+
+        # dirs_to_remove is already post-order, so children go before parents.
+        for d in dirs_to_remove:
+            try:
+                os.rmdir(d)
+            except Exception:
+                pass
+
+        if self.trim_after and FSTRIM_PROG and self._mountpoints_to_trim:
+            trimmed_bytes = 0
+            trimmed_devs = set()
+            for mp in sorted(self._mountpoints_to_trim):
+                dev = get_block_device_for_path(mp) or mp
+                # Bind mounts and subvolumes of one filesystem need one fstrim.
+                if dev in trimmed_devs:
+                    continue
+                trimmed_devs.add(dev)
+                if is_rotational_device(dev) is True:
+                    self._log(f"[TRIM] Skipping {mp}: {dev} is rotational")
+                    continue
+                self._log(f"[TRIM] fstrim {mp} ...")
+                rc, out, err = run([FSTRIM_PROG, "-v", mp])
                 if rc == 0:
-                    self.status.emit(out.strip())
+                    self._log(out.strip())
+                    m = re.search(r"\((\d+) bytes\) trimmed", out)
+                    if m:
+                        trimmed_bytes += int(m.group(1))
                 else:
-                    self.status.emit(f"[WARN] fstrim failed on {mp}: {err.strip()}")
+                    self._log(f"[WARN] fstrim failed on {mp}: {err.strip()}")
+            if len(trimmed_devs) > 1:
+                self._log(f"[TRIM] Total: {trimmed_bytes} bytes trimmed")
 
-        if done == total:
-            self.finished_ok.emit()
-        else:
+        if self._stop:
             self.finished_err.emit("Interrupted")
+        else:
+            if self._last_pct != PROGRESS_SCALE:
+                self.progress.emit(PROGRESS_SCALE)
+            self.finished_ok.emit()
 
-    def _wipe_file(self, f: str, shred_prog: Optional[str], srm_prog: Optional[str], rotational: Optional[bool], mountpoint: str):
+    def _advance(self, count: int = 1):
+        # Called from the pool threads as files finish; run() publishes it.
+        with self._progress_lock:
+            self._done += count
+
+    def _publish(self):
+        # Every emit is a cross-thread event plus a repaint, so pending
+        # per-file lines go out as one status and progress only if changed.
+        with self._log_lock:
+            self._flush_log()
+        with self._progress_lock:
+            pct = self._done * PROGRESS_SCALE // self._total if self._total else PROGRESS_SCALE
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.progress.emit(pct)
+
+    def _log(self, text: str):
+        # Flush pending per-file lines first so the log keeps its order.
+        with self._log_lock:
+            self._flush_log()
+            self.status.emit(text)
+
+    def _log_done(self, text: str):
+        # Per-file lines (shred passes, removals) are collected and sent by
+        # _publish as one multi-line status every EMIT_INTERVAL instead of
+        # one signal per line. _log is kept for headers, warnings and errors.
+        with self._log_lock:
+            self._log_buf.append(text)
+
+    def _flush_log(self):
+        if self._log_buf:
+            self.status.emit("\n".join(self._log_buf))
+            self._log_buf = []
+
+    def _wipe_throttled(self, sem: threading.Semaphore, batch: List[Tuple[str, str]], shred_prog: Optional[str], srm_prog: Optional[str],
+                        rotational: Optional[bool], skip_fs: Optional[str] = None, trim: bool = True):
+        with sem:
+            self._wipe_job(batch, shred_prog, srm_prog, rotational, skip_fs, trim)
+
+    def _wipe_job(self, batch: List[Tuple[str, str]], shred_prog: Optional[str], srm_prog: Optional[str],
+                  rotational: Optional[bool], skip_fs: Optional[str] = None, trim: bool = True):
+        if self._stop:
+            return
+        reported = 0
         try:
-            if rotational is True:
-                if shred_prog:
-                    cmd = [shred_prog, "-v"]
-                    if self.gutmann:
-                        cmd += ["-n", "35"]
-                    else:
-                        cmd += ["-n", str(max(1, self.passes))]
-                    cmd += ["-z", "-u", f]
-                    self.status.emit(f"[HDD] shred: {' '.join(cmd)}")
-                    rc, out, err = run(cmd)
-                    self.status.emit(out.strip())
-                    if rc != 0 and err.strip():
-                        self.status.emit(f"[WARN] shred error: {err.strip()}")
-                else:
-                    if srm_prog:
-                        cmd = [srm_prog, "-vz"]
-                        if self.gutmann:
-                            cmd += ["-s"]
-                        cmd += [f]
-                        self.status.emit(f"[HDD] srm: {' '.join(cmd)}")
-                        rc, out, err = run(cmd)
-                        self.status.emit(out.strip() or err.strip())
-                    else:
-                        try:
-                            size = os.path.getsize(f)
-                            with open(f, "wb") as fh:
-                                fh.write(os.urandom(min(size, 1024*1024)))
-                            os.remove(f)
-                            self.status.emit(f"[HDD] Fallback: 1x overwritten and removed: {f}")
-                        except Exception as e:
-                            self.status.emit(f"[ERR] {f}: {e}")
-
+            if skip_fs:
+                self._remove_batch([f for f, mp in batch], skip_fs)
             elif rotational is False:
-                try:
-                    if os.path.isfile(f):
-                        try:
-                            size = os.path.getsize(f)
-                            with open(f, "r+b") as fh:
-                                block = os.urandom(1024*1024)
-                                fh.seek(0)
-                                fh.write(block)
-                                if size > 2*1024*1024:
-                                    fh.seek(size - 1024*1024)
-                                    fh.write(block)
-                                fh.flush()
-                                os.fsync(fh.fileno())
-                        except Exception:
-                            pass
-                    os.remove(f)
-                    self.status.emit(f"[SSD] File removed (TRIM will run after completion): {f}")
-                except Exception as e:
-                    self.status.emit(f"[ERR] {f}: {e}")
+                self._wipe_batch_ssd([f for f, mp in batch])
+            elif shred_prog:
+                reported = self._wipe_batch_hdd([f for f, mp in batch], shred_prog, rotational, on_removed=self._advance)
             else:
-                if shred_prog:
-                    cmd = [shred_prog, "-v", "-n", str(max(1, self.passes)), "-z", "-u", f]
+                for f, mp in batch:
+                    self._wipe_file(f, srm_prog, rotational, mp)
+            if trim:
+                with self._trim_lock:
+                    self._mountpoints_to_trim.update(mp for f, mp in batch)
+        finally:
+            self._advance(len(batch) - reported)
+
+    def _wipe_batch_ssd(self, files: List[str]):
+        # No overwrite here: wear-leveling remaps the writes anyway, so they
+        # only cost wear. The freed blocks are discarded by fstrim afterwards.
+        for f in files:
+            try:
+                os.remove(f)
+                self._log_done(f"[SSD] File removed (TRIM will run after completion): {f}")
+            except Exception as e:
+                self._log(f"[ERR] {f}: {e}")
+
+    def _remove_batch(self, files: List[str], fstype: str):
+        # Filesystems where shred is pointless (see overwrite_is_futile).
+        for f in files:
+            try:
+                os.remove(f)
+                self._log_done(f"[FS] Shred skipped ({fstype}), removed: {f}")
+            except Exception as e:
+                self._log(f"[ERR] {f}: {e}")
+
+    def _wipe_batch_hdd(self, files: List[str], shred_prog: str, rotational: Optional[bool],
+                        on_removed: Optional[Callable[[], None]] = None) -> int:
+        """Shred files with one shred process, streaming its -v output; returns the number removed."""
+        tag = "[HDD]" if rotational is True else "[?]"
+        passes = 35 if self.gutmann else max(1, self.passes)
+        cmd = [shred_prog, "-v", "-n", str(passes), "-z", "-u"]
+        if len(files) == 1:
+            self._log(f"{tag} shred: {' '.join(cmd + files)}")
+        else:
+            self._log(f"{tag} shred: {' '.join(cmd)} <{len(files)} files>")
+        removed = 0
+        errors = []
+
+        def on_stderr(line: str):
+            nonlocal removed
+            # shred -v prefixes every line with argv[0]:
+            #   "<file>: pass 2/4 (random)...", "<file>: removed", or an error.
+            msg = line.split(": ", 1)[-1]
+            if ": pass " in msg:
+                self._log_done(f"{tag} {msg}")
+            elif msg.endswith(": removed"):
+                removed += 1
+                self._log_done(f"{tag} Shredded and removed: {msg[:-len(': removed')]}")
+                if on_removed:
+                    on_removed()
+            elif not (msg.endswith(": removing") or ": renamed to " in msg):
+                errors.append(msg)
+
+        rc, out, err = run_streaming(cmd + ["--"] + files, on_stderr=on_stderr)
+        if rc != 0 and errors:
+            self._log(f"[WARN] shred error: {' / '.join(errors)}")
+        return removed
+
+    def _overwrite_once(self, f: str):
+        # One pass of random data over the head (and tail) of the file, in
+        # place. O_DIRECT keeps the block out of the page cache; filesystems
+        # without O_DIRECT support (e.g. tmpfs) get a buffered write instead.
+        size = os.path.getsize(f)
+        try:
+            fd = os.open(f, os.O_WRONLY | os.O_DIRECT)
+        except OSError:
+            fd = None
+        if fd is not None:
+            try:
+                buf = memoryview(self._direct_block)
+                # Offsets and lengths must be aligned; round the end of the
+                # file up (the file is removed right after anyway).
+                end = -(-size // DIRECT_ALIGN) * DIRECT_ALIGN
+                os.pwrite(fd, buf[:min(end, OVERWRITE_BLOCK)], 0)
+                if size > 2*OVERWRITE_BLOCK:
+                    os.pwrite(fd, buf, end - OVERWRITE_BLOCK)
+                os.fsync(fd)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                return
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        with open(f, "r+b") as fh:
+            block = memoryview(self._rand_block)[:size]
+            fh.write(block)
+            if size > 2*OVERWRITE_BLOCK:
+                fh.seek(size - len(block))
+                fh.write(block)
+            fh.flush()
+            os.fsync(fh.fileno())
+            os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+    def _wipe_file(self, f: str, srm_prog: Optional[str], rotational: Optional[bool], mountpoint: str):
+        # Only reached without shred; shred and SSD files are handled in batches.
+        try:
+            if rotational is True:
+                if srm_prog:
+                    cmd = [srm_prog, "-vz"]
                     if self.gutmann:
-                        cmd = [shred_prog, "-v", "-n", "35", "-z", "-u", f]
-                    self.status.emit(f"[?] shred: {' '.join(cmd)}")
+                        cmd += ["-s"]
+                    cmd += [f]
+                    self._log(f"[HDD] srm: {' '.join(cmd)}")
                     rc, out, err = run(cmd)
-                    self.status.emit(out.strip())
-                    if rc != 0 and err.strip():
-                        self.status.emit(f"[WARN] shred error: {err.strip()}")
+                    self._log(out.strip() or err.strip())
                 else:
-                    os.remove(f)
-                    self.status.emit(f"[?] Fallback: removed: {f}")
+                    try:
+                        self._overwrite_once(f)
+                        os.remove(f)
+                        self._log_done(f"[HDD] Fallback: 1x overwritten and removed: {f}")
+                    except Exception as e:
+                        self._log(f"[ERR] {f}: {e}")
+            else:
+                os.remove(f)
+                self._log_done(f"[?] Fallback: removed: {f}")
 
         except Exception as e:
-            self.status.emit(f"[ERR] {f}: {e}")
+            self._log(f"[ERR] {f}: {e}")
+
+class BlkdiscardWorker(QtCore.QThread):
+    status = QtCore.pyqtSignal(str)
+    finished_ok = QtCore.pyqtSignal()
+    finished_err = QtCore.pyqtSignal(str)
+
+    def __init__(self, blkdiscard_prog: str, device: str):
+        super().__init__()
+        self.blkdiscard_prog = blkdiscard_prog
+        self.device = device
+
+    def run(self):
+        cmd = [self.blkdiscard_prog, "-f", "-v", self.device]
+        self.status.emit(f"[DEV] blkdiscard: {' '.join(cmd)}")
+        rc, out, err = run(cmd)
+        if out.strip():
+            self.status.emit(out.strip())
+        if rc == 0:
+            self.finished_ok.emit()
+        else:
+            self.finished_err.emit(err.strip() or f"blkdiscard exited with {rc}")
 
 class Main(QtWidgets.QMainWindow):
     def __init__(self):
@@ -293,6 +733,7 @@ class Main(QtWidgets.QMainWindow):
         self.setWindowIcon(QtGui.QIcon(self._icon_path()))
         self._build_ui()
         self.worker: Optional[ShredWorker] = None
+        self.discard_worker: Optional[BlkdiscardWorker] = None
 
     def _icon_path(self):
         cand = [
@@ -314,8 +755,11 @@ class Main(QtWidgets.QMainWindow):
         self.list = DropList()
         self.list.files_dropped.connect(self.add_paths)
 
-        add_btn = QtWidgets.QPushButton("Add files/folders")
-        add_btn.clicked.connect(self.add_dialog)
+        add_files_btn = QtWidgets.QPushButton("Add files")
+        add_files_btn.clicked.connect(self.add_files_dialog)
+
+        add_folder_btn = QtWidgets.QPushButton("Add folder")
+        add_folder_btn.clicked.connect(self.add_folder_dialog)
 
         rem_btn = QtWidgets.QPushButton("Remove selected")
         rem_btn.clicked.connect(self.remove_selected)
@@ -328,6 +772,12 @@ class Main(QtWidgets.QMainWindow):
         self.passes_spin.setRange(1, 35)
         self.passes_spin.setValue(3)
 
+        threads_label = QtWidgets.QLabel("Threads:")
+        self.threads_spin = QtWidgets.QSpinBox()
+        self.threads_spin.setRange(1, 64)
+        self.threads_spin.setValue(DEFAULT_THREADS)
+        self.threads_spin.setToolTip("Parallel wipes per SSD. HDDs are always wiped one file at a time.")
+
         self.gutmann_chk = QtWidgets.QCheckBox("Gutmann (35x)")
         self.gutmann_chk.stateChanged.connect(self._gutmann_toggle)
 
@@ -342,29 +792,38 @@ class Main(QtWidgets.QMainWindow):
         self.log = LogView()
 
         self.progress = QtWidgets.QProgressBar()
-        self.progress.setRange(0, 100)
+        self.progress.setRange(0, PROGRESS_SCALE)
         self.progress.setValue(0)
         self.progress.setTextVisible(True)
 
         shred_btn = QtWidgets.QPushButton("⚠️ Secure Delete")
         shred_btn.clicked.connect(self.start_shred)
 
+        discard_btn = QtWidgets.QPushButton("Secure erase whole device (blkdiscard)")
+        discard_btn.clicked.connect(self.blkdiscard_dialog)
+
         layout = QtWidgets.QGridLayout(central)
         layout.addWidget(title, 0, 0, 1, 3)
         layout.addWidget(subtitle, 1, 0, 1, 3)
         layout.addWidget(self.list, 2, 0, 1, 3)
-        layout.addWidget(add_btn, 3, 0)
-        layout.addWidget(rem_btn, 3, 1)
-        layout.addWidget(clear_btn, 3, 2)
+        list_buttons = QtWidgets.QHBoxLayout()
+        list_buttons.addWidget(add_files_btn)
+        list_buttons.addWidget(add_folder_btn)
+        list_buttons.addWidget(rem_btn)
+        list_buttons.addWidget(clear_btn)
+        layout.addLayout(list_buttons, 3, 0, 1, 3)
         layout.addWidget(passes_label, 4, 0)
         layout.addWidget(self.passes_spin, 4, 1)
         layout.addWidget(self.gutmann_chk, 4, 2)
-        layout.addWidget(self.ssd_chk, 5, 0, 1, 3)
-        layout.addWidget(self.trim_chk, 6, 0, 1, 3)
-        layout.addWidget(warn, 7, 0, 1, 3)
-        layout.addWidget(self.progress, 8, 0, 1, 3)
-        layout.addWidget(shred_btn, 9, 0, 1, 3)
-        layout.addWidget(self.log, 10, 0, 1, 3)
+        layout.addWidget(threads_label, 5, 0)
+        layout.addWidget(self.threads_spin, 5, 1)
+        layout.addWidget(self.ssd_chk, 6, 0, 1, 3)
+        layout.addWidget(self.trim_chk, 7, 0, 1, 3)
+        layout.addWidget(warn, 8, 0, 1, 3)
+        layout.addWidget(self.progress, 9, 0, 1, 3)
+        layout.addWidget(shred_btn, 10, 0, 1, 3)
+        layout.addWidget(discard_btn, 11, 0, 1, 3)
+        layout.addWidget(self.log, 12, 0, 1, 3)
 
         self.setStyleSheet(f"""
             QWidget {{ background: {DARK}; color: #ddd; font-family: 'JetBrainsMono Nerd Font', monospace; }}
@@ -384,19 +843,31 @@ class Main(QtWidgets.QMainWindow):
             self.passes_spin.setEnabled(True)
 
     def add_paths(self, paths: List[str]):
-        for p in paths:
-            p = os.path.abspath(p)
-            if not os.path.exists(p):
-                continue
-            item = QtWidgets.QListWidgetItem(p)
-            self.list.addItem(item)
-
-    def add_dialog(self):
-        dlg = QtWidgets.QFileDialog(self, "Select files/folders")
+        paths = [os.path.abspath(p) for p in paths]
+        # Big drops: overlap the existence checks (slow on network homes).
+        if len(paths) > BULK_ADD_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=DEFAULT_THREADS) as pool:
+                exists = list(pool.map(os.path.exists, paths))
+        else:
+            exists = [os.path.exists(p) for p in paths]
+        valid = [p for p, ok in zip(paths, exists) if ok]
+        if not valid:
+            return
+        # One model insert and one relayout instead of one per item.
+        self.list.setUpdatesEnabled(False)
+        try:
+            self.list.addItems(valid)
+        finally:
+            self.list.setUpdatesEnabled(True)
+
+    def add_files_dialog(self):
+        dlg = QtWidgets.QFileDialog(self, "Select files")
         dlg.setFileMode(QtWidgets.QFileDialog.ExistingFiles)
         if dlg.exec_():
             sel = dlg.selectedFiles()
             self.add_paths(sel)
+
+    def add_folder_dialog(self):
         dirp = QtWidgets.QFileDialog.getExistingDirectory(self, "Select folder")
         if dirp:
             self.add_paths([dirp])
@@ -423,16 +894,68 @@ class Main(QtWidgets.QMainWindow):
         gutmann = self.gutmann_chk.isChecked()
         ssd_mode = self.ssd_chk.isChecked()
         trim_after = self.trim_chk.isChecked()
+        threads = self.threads_spin.value()
 
         self.progress.setValue(0)
-        self.log.log(f"==> Start: {len(paths)} target(s), passes={passes if not gutmann else 35}, SSD-optimization={'on' if ssd_mode else 'off'}, TRIM={'on' if trim_after else 'off'}")
-        self.worker = ShredWorker(paths, passes, gutmann, ssd_mode, trim_after)
+        self.log.log(f"==> Start: {len(paths)} target(s), passes={passes if not gutmann else 35}, threads={threads}, SSD-optimization={'on' if ssd_mode else 'off'}, TRIM={'on' if trim_after else 'off'}")
+        self.worker = ShredWorker(paths, passes, gutmann, ssd_mode, trim_after, threads)
         self.worker.status.connect(self.log.log)
         self.worker.progress.connect(self.progress.setValue)
         self.worker.finished_ok.connect(lambda: self.log.log("==> Finished."))
         self.worker.finished_err.connect(lambda msg: self.log.log(f"==> Completed with error: {msg}"))
         self.worker.start()
 
+    def blkdiscard_dialog(self):
+        if self.discard_worker and self.discard_worker.isRunning():
+            QtWidgets.QMessageBox.warning(self, APP_NAME, "A blkdiscard is still running. Wait for it to finish.")
+            return
+        if not BLKDISCARD_PROG:
+            QtWidgets.QMessageBox.warning(self, APP_NAME, "blkdiscard not found (install util-linux).")
+            return
+
+        dev, ok = QtWidgets.QInputDialog.getText(
+            self, "Secure erase whole device",
+            "Block device to discard (e.g. /dev/sdX, /dev/nvme0n1p3, /dev/loop0):"
+        )
+        dev = dev.strip()
+        if not ok or not dev:
+            return
+        try:
+            is_block = stat.S_ISBLK(os.stat(dev).st_mode)
+        except OSError:
+            is_block = False
+        if not is_block:
+            QtWidgets.QMessageBox.warning(self, APP_NAME, f"{dev} is not a block device.")
+            return
+        rc, out, err = run(["lsblk", "-nro", "MOUNTPOINT", dev])
+        if rc != 0:
+            # blkdiscard -f skips its own in-use check, so never guess here.
+            QtWidgets.QMessageBox.warning(self, APP_NAME, f"Could not check whether {dev} is in use (lsblk: {err.strip() or f'exit code {rc}'}).")
+            return
+        mounted = [m for m in out.splitlines() if m.strip()]
+        if mounted:
+            QtWidgets.QMessageBox.warning(self, APP_NAME, f"{dev} is in use (mounted at {', '.join(mounted)}). Unmount it first.")
+            return
+        holders = get_holders(dev)
+        if holders:
+            QtWidgets.QMessageBox.warning(self, APP_NAME, f"{dev} is in use by {', '.join(holders)} (LVM, RAID or dm-crypt). Release it first.")
+            return
+
+        reply = QtWidgets.QMessageBox.warning(
+            self, "Confirmation",
+            f"This will DISCARD EVERY BLOCK on {dev}.\nAll data on the device will be lost.\nContinue?",
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+        )
+        if reply != QtWidgets.QMessageBox.Yes:
+            return
+
+        self.log.log(f"==> blkdiscard: {dev}")
+        self.discard_worker = BlkdiscardWorker(BLKDISCARD_PROG, dev)
+        self.discard_worker.status.connect(self.log.log)
+        self.discard_worker.finished_ok.connect(lambda: self.log.log("==> Device discarded."))
+        self.discard_worker.finished_err.connect(lambda msg: self.log.log(f"==> blkdiscard failed: {msg}"))
+        self.discard_worker.start()
+
     def dragEnterEvent(self, e: QtGui.QDragEnterEvent):
         if e.mimeData().hasUrls():
             e.acceptProposedAction()